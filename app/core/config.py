@@ -2,6 +2,11 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings): 
     DATABASE_URL: str 
+    DEBUG: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    # Số worker uvicorn; tổng connection tối đa = WEB_CONCURRENCY * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    WEB_CONCURRENCY: int = 1
 
     model_config = SettingsConfigDict(
         env_file= ".env",
@@ -3,12 +3,24 @@ from sqlmodel import SQLModel
 from app.core.config import config
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
+from sqlalchemy import text
+import asyncio
 
 async_engine: AsyncEngine = create_async_engine(
     url=config.DATABASE_URL,
-    echo=True, 
+    # Không dùng echo: echo gắn StreamHandler ghi log đồng bộ; log SQL cấu hình trong app.core.logging_config
+    echo=False, 
     future=True,
     pool_pre_ping=True,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
+    pool_recycle=1800,
+    pool_timeout=30,
+    # Tắt cache của asyncpg, dùng cache prepared statement của SQLAlchemy cho cả pool
+    connect_args={
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 500,
+    },
 )
 
 #tạo một session factory 
@@ -33,13 +45,26 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     finally: 
         await session.close()
 
-# Dependency để sử dụng trong FastAPI routes
-async def get_session()-> AsyncGenerator[AsyncSession, None]: 
+# Dependency cho các route chỉ đọc: không COMMIT, đóng session sẽ rollback và trả connection về pool
+async def get_read_session()-> AsyncGenerator[AsyncSession, None]: 
     async with async_session_maker() as session: 
         yield session
 
-# Hàm khởi tạo DB (chạy lúc server start)
+# Dependency cho các route ghi dữ liệu (commit một lần khi request thành công)
+async def get_write_session()-> AsyncGenerator[AsyncSession, None]: 
+    async with get_db_session() as session: 
+        yield session
+
+# Hàm tạo bảng trực tiếp từ model, chỉ dùng cho test/dev. Production chạy: alembic upgrade head
 async def init_db() -> None:
     async with async_engine.begin() as conn:
         from app.modular.book_module.models.book_model import Book
         await conn.run_sync(SQLModel.metadata.create_all)
+
+# Mở sẵn DB_POOL_SIZE connection lúc start để request đầu không phải chờ bắt tay TCP/auth
+async def warm_up_pool() -> None:
+    async def _ping() -> None:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(config.DB_POOL_SIZE)))
@@ -0,0 +1,35 @@
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+from app.core.config import config
+
+# QueueHandler mặc định gọi self.format(record) trong prepare(), tức là format ngay trên event loop.
+# Queue ở đây là SimpleQueue trong cùng process (không pickle) nên đẩy nguyên record,
+# để message (kể cả repr của bind params) được dựng trên thread của QueueListener.
+class _DeferredFormatQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+# Cấu hình log của SQLAlchemy engine.
+# Production: chỉ log từ WARNING trở lên.
+# DEBUG: log SQL ở mức INFO, nhưng event loop chỉ đẩy record vào queue,
+# việc format và ghi ra stream do thread của QueueListener làm.
+def setup_logging() -> Optional[QueueListener]:
+    engine_logger = logging.getLogger("sqlalchemy.engine")
+
+    if not config.DEBUG:
+        engine_logger.setLevel(logging.WARNING)
+        return None
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+
+    engine_logger.setLevel(logging.INFO)
+    engine_logger.addHandler(_DeferredFormatQueueHandler(log_queue))
+    engine_logger.propagate = False
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -1,27 +1,120 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, status, Depends, Query, Response, Body, Request
 from fastapi.exceptions import HTTPException
-from app.modular.book_module.schemas.book_schemas import BookCreateModule, BookUpdateModule, BookResponse
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.db import get_read_session, get_write_session
+from app.modular.book_module.schemas.book_schemas import BookCreateRequest, BookUpdateRequest, BookResponse
+from app.modular.book_module.services.book_service import BookServices, get_book_service
+from pydantic import TypeAdapter
+from typing import List, Optional
+from datetime import datetime
+import uuid
 
 router = APIRouter() 
 
-@router.get("", response_model= List[BookResponse])
-async def get_all_books(): 
-    pass
+# Adapter dựng sẵn lúc import để dùng lại cho mọi response danh sách sách
+BOOKS_ADAPTER = TypeAdapter(List[BookResponse])
+
+# Không khai báo response_model để FastAPI không validate lại cả list; vẫn giữ schema cho OpenAPI
+@router.get("", responses= {status.HTTP_200_OK: {"model": List[BookResponse]}})
+async def get_all_books(
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    after: Optional[datetime] = None,
+    after_uid: Optional[uuid.UUID] = None,
+    session: AsyncSession = Depends(get_read_session),
+    book_service: BookServices = Depends(get_book_service),
+):
+    # Cursor gồm cả created_at và uid của dòng cuối trang trước, phải gửi đủ cả hai
+    if (after is None) != (after_uid is None):
+        raise HTTPException(status_code= status.HTTP_422_UNPROCESSABLE_ENTITY, detail= "after and after_uid must be given together")
+
+    books = await book_service.get_all_books(session, limit=limit, offset=offset, after=after, after_uid=after_uid)
+    # Một lượt validate từ Row và serialize thẳng ra bytes JSON
+    return Response(
+        content= BOOKS_ADAPTER.dump_json(BOOKS_ADAPTER.validate_python(books)),
+        media_type= "application/json",
+    )
 
 @router.post("", response_model= BookResponse, status_code= status.HTTP_201_CREATED)
-async def create_books(book_data: BookCreateModule):
-    new_book = book_data.model_dump() #model_dump() chuyển đổi object -> dict
+async def create_books(
+    book_data: BookCreateRequest,
+    session: AsyncSession = Depends(get_write_session),
+    book_service: BookServices = Depends(get_book_service),
+):
+    return await book_service.create_book(book_data, session)
+
+# Tạo nhiều sách trong một câu INSERT thay vì một request cho mỗi sách
+@router.post("/bulk", response_model= List[BookResponse], status_code= status.HTTP_201_CREATED)
+async def create_books_bulk(
+    books_data: List[BookCreateRequest],
+    session: AsyncSession = Depends(get_write_session),
+    book_service: BookServices = Depends(get_book_service),
+):
+    return await book_service.create_books_bulk(books_data, session)
+
+# Lấy nhiều sách theo danh sách uid trong một round-trip
+@router.post("/by-ids", responses= {status.HTTP_200_OK: {"model": List[BookResponse]}})
+async def get_books_by_ids(
+    book_ids: List[uuid.UUID] = Body(..., max_length=100),
+    session: AsyncSession = Depends(get_read_session),
+    book_service: BookServices = Depends(get_book_service),
+):
+    books = await book_service.get_books_by_ids(book_ids, session)
+    return Response(
+        content= BOOKS_ADAPTER.dump_json(BOOKS_ADAPTER.validate_python(books)),
+        media_type= "application/json",
+    )
+
+# ETag yếu dựng từ updated_at (micro giây), đổi mỗi khi sách được cập nhật
+def _book_etag(updated_at: datetime) -> str:
+    return f'W/"{int(updated_at.timestamp() * 1_000_000)}"'
+
+# If-None-Match so sánh yếu (RFC 9110): bỏ tiền tố W/ ở cả hai phía
+def _weak_etag_value(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
 
 @router.get("/{book_id}", response_model= BookResponse)
-async def get_book(book_id: int ): 
-    pass
+async def get_book(
+    book_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_read_session),
+    book_service: BookServices = Depends(get_book_service),
+):
+    book = await book_service.get_book(book_id, session)
+    if book is None:
+        raise HTTPException(status_code= status.HTTP_404_NOT_FOUND, detail= "Book not found")
+
+    etag = _book_etag(book.updated_at)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        client_etags = [_weak_etag_value(tag.strip()) for tag in if_none_match.split(",")]
+        # Client đã có bản mới nhất: trả 304, bỏ qua bước serialize
+        if _weak_etag_value(etag) in client_etags or "*" in client_etags:
+            return Response(status_code= status.HTTP_304_NOT_MODIFIED, headers= {"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return book
 
 @router.patch("/{book_id}", response_model= BookResponse)
-async def update_book(book_id: int, update_data: BookUpdateModule): 
-    pass
+async def update_book(
+    book_id: uuid.UUID,
+    update_data: BookUpdateRequest,
+    session: AsyncSession = Depends(get_write_session),
+    book_service: BookServices = Depends(get_book_service),
+):
+    book = await book_service.update_book(book_id, update_data, session)
+    if book is None:
+        raise HTTPException(status_code= status.HTTP_404_NOT_FOUND, detail= "Book not found")
+    return book
 
 
 @router.delete("/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_book(book_id: int): 
-    pass
\ No newline at end of file
+async def delete_book(
+    book_id: uuid.UUID,
+    session: AsyncSession = Depends(get_write_session),
+    book_service: BookServices = Depends(get_book_service),
+):
+    deleted = await book_service.delete_book(book_id, session)
+    if not deleted:
+        raise HTTPException(status_code= status.HTTP_404_NOT_FOUND, detail= "Book not found")
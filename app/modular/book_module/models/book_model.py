@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Column
+from sqlalchemy import Index
 from datetime import datetime, date 
 import uuid 
 import sqlalchemy.dialects.postgresql as pg
@@ -6,6 +7,8 @@ from sqlalchemy.sql import func
 
 class Book(SQLModel, table=True): 
     __tablename__ = "books"
+    # Index cho ORDER BY created_at DESC, uid DESC và cursor (created_at, uid) khi phân trang
+    __table_args__ = (Index("ix_books_created_at_uid", "created_at", "uid"),)
     
     uid: uuid.UUID = Field(
         sa_column=Column(
@@ -15,21 +18,22 @@ class Book(SQLModel, table=True):
             default=uuid.uuid4
         )
     )
-    title: str 
-    author: str
+    # uid là primary key nên đã có index; thêm index cho các cột dùng để tìm kiếm
+    title: str = Field(index=True)
+    author: str = Field(index=True)
     publisher: str
     published_date: date
     page_count: int
     language: str 
     # Sử dụng func.now() thay vì datetime.now để tránh vấn đề timezone
     created_at: datetime = Field(
-        sa_column=Column(pg.TIMESTAMP, 
+        sa_column=Column(pg.TIMESTAMP(timezone=True), 
         default=func.now(), 
         nullable=False)
     )
     updated_at: datetime = Field(
         sa_column=Column(
-            pg.TIMESTAMP, 
+            pg.TIMESTAMP(timezone=True), 
             default=func.now(), 
             onupdate=func.now(),  # Tự động cập nhật khi record thay đổi
             nullable=False
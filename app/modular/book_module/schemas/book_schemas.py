@@ -1,33 +1,27 @@
-from pydantic import BaseModel 
+from pydantic import BaseModel, ConfigDict
 import uuid
-from datetime import datetime
+from datetime import datetime, date
 
-class Book(BaseModel): 
+class BookBase(BaseModel): 
     title: str 
     author: str
     publisher: str
-    published_date: str
+    published_date: date
     page_count: int
     language: str 
-    created_at: datetime
-    updated_at: datetime 
     
 
-class BookResponse(BaseModel): 
-    id: uuid.UUID
-    
-class BookCreateModule(BaseModel): 
-    title: str
-    author: str
-    publisher: str
-    published_date: str
+class BookResponse(BookBase): 
+    model_config = ConfigDict(from_attributes=True)
+
+    uid: uuid.UUID
     created_at: datetime
-    updated_at: datetime 
+    
+class BookCreateRequest(BookBase): 
+    pass
 
-class BookUpdateModule(BaseModel):
+class BookUpdateRequest(BaseModel):
     title: str | None = None 
     author: str | None = None
     publisher: str | None = None
     page_count: int | None = None
-
-
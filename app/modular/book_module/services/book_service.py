@@ -1,115 +1,152 @@
-from sqlmodel.ext.asyncio.session import AsyncSession 
-from schemas.book_schemas import BookCreateModule, BookUpdateModule
-from sqlmodel import text
-from datetime import datetime 
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.modular.book_module.schemas.book_schemas import BookCreateRequest, BookUpdateRequest
+from app.modular.book_module.models.book_model import Book
+from sqlalchemy import select, insert, update, delete, bindparam, tuple_, literal
+from datetime import datetime
+from typing import List, Optional
 import uuid
-class BookServices: 
-    async def get_all_books(self, session: AsyncSession) : 
-        statement = text(
-            """
-            SELECT * FROM books
-            ORDER BY created_at DESC
-            """
-        )
 
-        result = await session.execute(statement= statement)
-        books = [dict(row) for row in result.mappings().all()]
-        return books 
+# Giới hạn số dòng mỗi câu INSERT để không vượt quá số tham số tối đa của Postgres
+BULK_INSERT_BATCH_SIZE = 500
+
+# Các statement dựng sẵn một lần ở module, SQLAlchemy dùng lại bản đã compile trong cache
+# Chỉ lấy các cột mà BookResponse trả về, không SELECT *
+_BOOK_RESPONSE_COLUMNS = (
+    Book.uid,
+    Book.title,
+    Book.author,
+    Book.publisher,
+    Book.published_date,
+    Book.page_count,
+    Book.language,
+    Book.created_at,
+)
+
+# created_at không duy nhất (mọi dòng trong một transaction có cùng now()) nên thêm uid để thứ tự cố định
+_GET_ALL_BOOKS_STMT = select(*_BOOK_RESPONSE_COLUMNS).order_by(Book.created_at.desc(), Book.uid.desc())
+
+# expanding=True: một statement dùng cho mọi độ dài danh sách uid
+_GET_BOOKS_BY_IDS_STMT = select(*_BOOK_RESPONSE_COLUMNS).where(
+    Book.uid.in_(bindparam("book_uids", expanding=True))
+)
+
+_GET_BOOK_STMT = select(Book).where(Book.uid == bindparam("book_uid"))
+
+_INSERT_BOOK_STMT = insert(Book).returning(Book)
+
+_DELETE_BOOK_STMT = delete(Book).where(Book.uid == bindparam("book_uid"))
+
+# Các cột BookUpdateRequest cho phép sửa; bit thứ i của mask ứng với cột thứ i
+_UPDATABLE_FIELDS = ("title", "author", "publisher", "page_count")
+
+def _build_update_stmt(fields):
+    # Tên bindparam phải khác tên cột trong SET nên thêm tiền tố "new_"
+    # updated_at không nằm trong SET: onupdate=func.now() của cột tự thêm vào câu UPDATE
+    values = {field: bindparam(f"new_{field}") for field in fields}
+    return (
+        update(Book)
+        .where(Book.uid == bindparam("book_uid"))
+        .values(values)
+        .returning(Book)
+        # Giá trị nằm trong bindparam nên ORM không tự đồng bộ object đã load; ghi đè bằng dòng RETURNING
+        .execution_options(populate_existing=True)
+    )
+
+# Dựng sẵn 2^4 - 1 câu UPDATE cho mọi tổ hợp cột, request chỉ cần tra theo mask
+_UPDATE_BOOK_STMTS = {
+    mask: _build_update_stmt(
+        [field for bit, field in enumerate(_UPDATABLE_FIELDS) if mask & (1 << bit)]
+    )
+    for mask in range(1, 1 << len(_UPDATABLE_FIELDS))
+}
+
+class BookServices:
+    async def get_all_books(
+        self,
+        session: AsyncSession,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[datetime] = None,
+        after_uid: Optional[uuid.UUID] = None,
+    ) :
+        statement = _GET_ALL_BOOKS_STMT
+
+        # Keyset pagination: đi tiếp từ (created_at, uid) của dòng cuối trang trước, không phải quét lại offset
+        # Route đã bảo đảm after và after_uid luôn đi cùng nhau
+        if after is not None:
+            # literal() giữ đúng kiểu cột (timestamptz, uuid) cho tham số cursor
+            cursor = tuple_(literal(after, Book.created_at.type), literal(after_uid, Book.uid.type))
+            statement = statement.where(tuple_(Book.created_at, Book.uid) < cursor)
+
+        statement = statement.limit(limit).offset(offset)
 
-    async def get_book(self, book_uid: str, session: AsyncSession): 
-        statement = text(
-            """
-            SELECT * FROM books 
-            WHERE uid = :uid
-            """
-        )
+        result = await session.execute(statement= statement)
+        # Trả thẳng các Row, BookResponse đọc theo thuộc tính (from_attributes)
+        return result.all()
 
-        result = await session.execute(statement= statement, params= {"uid": book_uid})
-        row = result.mappings().first()
+    async def get_book(self, book_uid: uuid.UUID, session: AsyncSession):
+        result = await session.execute(statement= _GET_BOOK_STMT, params= {"book_uid": book_uid})
+        return result.scalar_one_or_none()
 
-        if row is None: 
-            return None 
-        return dict()
+    async def get_books_by_ids(self, book_uids: List[uuid.UUID], session: AsyncSession):
+        if not book_uids:
+            return []
 
-    async def create_book(self, book_data: BookCreateModule, session: AsyncSession): 
-        book_uid = uuid.uuid4()
-        current_time = datetime.now()
+        # Một câu SELECT ... WHERE uid IN (...) thay vì một truy vấn cho mỗi uid
+        result = await session.execute(statement= _GET_BOOKS_BY_IDS_STMT, params= {"book_uids": book_uids})
+        return result.all()
 
+    async def create_book(self, book_data: BookCreateRequest, session: AsyncSession):
         params ={
-            "uid": book_uid, 
-            **book_data.model_dump(), 
-            "page_count": 0, 
-            "language": ""
+            "uid": uuid.uuid4(),
+            **book_data.model_dump()
         }
 
+        result = await session.execute(statement= _INSERT_BOOK_STMT, params= [params])
+
+        return result.scalar_one()
+
+    async def create_books_bulk(self, books_data: List[BookCreateRequest], session: AsyncSession):
+        books = []
+        for start in range(0, len(books_data), BULK_INSERT_BATCH_SIZE):
+            rows = [
+                {
+                    "uid": uuid.uuid4(),
+                    **book_data.model_dump()
+                }
+                for book_data in books_data[start:start + BULK_INSERT_BATCH_SIZE]
+            ]
+
+            # Nhiều dòng trên cùng một statement -> SQLAlchemy gộp thành INSERT nhiều VALUES
+            result = await session.execute(statement= _INSERT_BOOK_STMT, params= rows)
+            books.extend(result.scalars().all())
+
+        return books
+
+    async def update_book(self, book_uid: uuid.UUID, book_update_data: BookUpdateRequest, session: AsyncSession):
+        update_dict = book_update_data.model_dump(exclude_unset= True)
+
+        mask = 0
+        params = {"book_uid": book_uid}
+        for bit, field in enumerate(_UPDATABLE_FIELDS):
+            value = update_dict.get(field)
+            if value is not None:
+                mask |= 1 << bit
+                params[f"new_{field}"] = value
+
+        if not mask:
+            return await self.get_book(book_uid, session)
+
+        result = await session.execute(statement= _UPDATE_BOOK_STMTS[mask], params= params)
+
+        return result.scalar_one_or_none()
+
+    async def delete_book(self, book_uid: uuid.UUID, session: AsyncSession):
+        result = await session.execute(statement= _DELETE_BOOK_STMT, params= {"book_uid": book_uid})
+        return result.rowcount > 0
+
+# Service không giữ trạng thái nên dùng chung một instance cho mọi request
+book_service = BookServices()
 
-        statement = text(
-            """
-            IINSERT INTO books (uid, title, author, publisher, published_date, 
-                              page_count, language, created_at, updated_at)
-                        VALUES (:uid, :title, :author, :publisher, :published_date, 
-                   :page_count, :language, :created_at, :updated_at)
-            RETURING * 
-            """ 
-        )
-
-        result = await session.execute(statement= statement, params= params)
-        await session.commit() 
-
-        book = result.mappings().first 
-
-        return dict(book)
-
-    async def update_book(self, book_uid:str ,book_update_data: BookUpdateModule, session: AsyncSession): 
-        book = await self.get_book(book_uid, session)
-        if book is None: 
-            return None 
-        
-        update_fields = [] 
-        params = {"uid": book_uid}
-
-        update_dict = book_update_data.model_dump(exclude_unset= True) 
-        for field, value in update_dict.items(): 
-            if value is not None: 
-                update_fields.append(f"{field} = :{field}")
-                params[field] = value 
-        
-        update_fields.append("updated_at = :updated_at")
-        params["updated_at"] = datetime.now()
-
-        if len(update_fields) == 1: 
-            return book
-        
-        update_data = ", ".join(update_fields)
-        statement = text(
-            f"""
-                UPDATE books 
-                SET {update_data}
-                WHERE uid = :uid
-                RETURNING *
-            """
-        )
-
-        result = await session.execute(statement= statement, params= params)
-        await session.commit()
-
-        book = result.mappings().first() 
-        if book is None: 
-            return None 
-        return book 
-    async def delete_book(self, book_uid:str,  session: AsyncSession): 
-        book = await self.get_book(book_uid= book_uid, session= session)
-        if book is None: 
-            return None 
-        
-        statement = text(
-            """
-            DELETE FROM books 
-            WHERE uid = :uid
-            """     
-        )
-
-        result = await session.execute(statement= statement, params={"uid": book_uid})
-        session.commit() 
-        
-        return result.rowcount > 0 
+def get_book_service() -> BookServices:
+    return book_service
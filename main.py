@@ -1,27 +1,47 @@
 from fastapi import FastAPI 
-from app.modular.book_module.api.v1.endpoints import router as book_routers 
+from fastapi.responses import ORJSONResponse
+from app.modular.book_module.api.v1 import api_router as book_routers 
 from contextlib import asynccontextmanager
-from app.core.db import init_db
+from app.core.db import warm_up_pool
+from app.core.logging_config import setup_logging
 
 @asynccontextmanager
 async def life_span(app: FastAPI): 
+    # Schema do Alembic quản lý (alembic upgrade head lúc deploy), không create_all lúc start
+    log_listener = setup_logging()
     print("Server is start")
-    await init_db()
+    await warm_up_pool()
     yield
     print("Server has been stopped")
+    if log_listener is not None:
+        log_listener.stop()
 
 version = "v1"
 app = FastAPI(
     title="Book",
     description="Hoc API",
     version= version,
-    lifespan= life_span
+    lifespan= life_span,
+    default_response_class= ORJSONResponse
 ) 
 
 app.include_router(book_routers, prefix=f"/api/{version}")
 
 
-
-
-
-
+if __name__ == "__main__":
+    import uvicorn
+    from app.core.config import config
+
+    # loop="auto" dùng uvloop khi đã cài (Linux/macOS), http="httptools" parse HTTP bằng C.
+    # Mỗi worker có pool riêng và mở sẵn DB_POOL_SIZE connection lúc start, nên số worker lấy từ
+    # WEB_CONCURRENCY (mặc định 1) để chỉnh cùng kích thước pool theo max_connections của Postgres.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="httptools",
+        workers=config.WEB_CONCURRENCY,
+        backlog=2048,
+        limit_concurrency=1024,
+    )
@@ -0,0 +1,46 @@
+"""create books table
+
+Khớp đúng schema mà init_db (SQLModel.metadata.create_all) tạo ở baseline: chỉ có bảng, chưa có index.
+DB đã được tạo bằng init_db cũ thì không chạy revision này, đánh dấu bằng:
+    alembic stamp 0001
+rồi chạy alembic upgrade head như bình thường.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "books",
+        sa.Column("uid", postgresql.UUID(), nullable=False),
+        sa.Column("title", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("author", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("publisher", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("published_date", sa.Date(), nullable=False),
+        sa.Column("page_count", sa.Integer(), nullable=False),
+        sa.Column("language", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("created_at", postgresql.TIMESTAMP(), nullable=False),
+        sa.Column("updated_at", postgresql.TIMESTAMP(), nullable=False),
+        sa.PrimaryKeyConstraint("uid"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("books")
@@ -0,0 +1,33 @@
+"""books indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_books_title", "books", ["title"])
+    op.create_index("ix_books_author", "books", ["author"])
+    # Index cho ORDER BY created_at DESC, uid DESC và cursor (created_at, uid) khi phân trang
+    op.create_index("ix_books_created_at_uid", "books", ["created_at", "uid"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_books_created_at_uid", table_name="books")
+    op.drop_index("ix_books_author", table_name="books")
+    op.drop_index("ix_books_title", table_name="books")
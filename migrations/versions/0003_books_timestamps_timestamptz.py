@@ -0,0 +1,47 @@
+"""books timestamps to timestamptz
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Không có USING: giá trị cũ được hiểu theo TimeZone của session Postgres.
+    # Trước revision này update_book ghi updated_at bằng datetime.now() (giờ local của máy chạy app),
+    # và create nhận created_at/updated_at do client gửi, nên các dòng đó có thể lệch
+    # đúng bằng chênh lệch múi giờ giữa máy app (hoặc client) và DB.
+    for column in ("created_at", "updated_at"):
+        op.alter_column(
+            "books",
+            column,
+            type_=postgresql.TIMESTAMP(timezone=True),
+            existing_type=postgresql.TIMESTAMP(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in ("created_at", "updated_at"):
+        op.alter_column(
+            "books",
+            column,
+            type_=postgresql.TIMESTAMP(),
+            existing_type=postgresql.TIMESTAMP(timezone=True),
+            existing_nullable=False,
+        )